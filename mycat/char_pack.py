@@ -149,7 +149,10 @@ def gif_frames(data: bytes, scale: float):
             rgba = rgba.resize((max(1, round(rgba.width * scale)), max(1, round(rgba.height * scale))))
         buffer = rgba.tobytes("raw", "RGBA")
         qimage = QtGui.QImage(buffer, rgba.width, rgba.height, QtGui.QImage.Format.Format_RGBA8888)
-        frames.append(QtGui.QPixmap.fromImage(qimage.copy()))
+        # fromImage already deep-copies out of the borrowed buffer (which stays
+        # alive through this call), so an intermediate QImage.copy() would just
+        # be a second pass over the frame's pixels.
+        frames.append(QtGui.QPixmap.fromImage(qimage))
         delays.append(int(image.info.get("duration", 100)))
     return frames, delays
 
@@ -174,6 +177,8 @@ def load_pack(path, max_width: int = DEFAULT_MAX_WIDTH, max_height: int = DEFAUL
         scale = min(max_w / native_w, max_h / native_h, 1.0)   # shrink-to-fit only
 
         def by_scale(raw):
+            if scale == 1.0:  # already fits the box — skip the resample + copy
+                return raw
             return raw.scaled(
                 max(1, round(raw.width() * scale)), max(1, round(raw.height() * scale)),
                 QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
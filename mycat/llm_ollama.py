@@ -7,6 +7,25 @@ import urllib.error
 import urllib.request
 from typing import Any
 
+# Optional C-backed JSON codec — worthwhile on long assistant replies; the
+# stdlib json module is the fallback, same as psutil/icalendar elsewhere.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_encode(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _json_decode(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class OllamaBackend:
     """Call the local Ollama HTTP API."""
@@ -25,7 +44,7 @@ class OllamaBackend:
             ],
             "stream": False,
         }
-        data = json.dumps(payload).encode("utf-8")
+        data = _json_encode(payload)
         request = urllib.request.Request(
             self.chat_url,
             data=data,
@@ -35,7 +54,7 @@ class OllamaBackend:
 
         try:
             with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                raw = response.read().decode("utf-8")
+                raw = response.read()
         except urllib.error.HTTPError as exc:
             detail = exc.read().decode("utf-8", errors="ignore") if exc.fp else ""
             raise RuntimeError(
@@ -45,8 +64,8 @@ class OllamaBackend:
             raise RuntimeError(f"Ollama connection error: {exc.reason}") from exc
 
         try:
-            body = json.loads(raw)
-        except json.JSONDecodeError as exc:
+            body = _json_decode(raw)
+        except ValueError as exc:
             raise RuntimeError(f"Ollama returned invalid JSON: {exc}") from exc
 
         message = body.get("message", {}).get("content", "")
@@ -66,7 +85,7 @@ def fetch_models(base_url: str, timeout: float = 10.0) -> list:
     request = urllib.request.Request(tags_url, method="GET")
     try:
         with urllib.request.urlopen(request, timeout=timeout) as response:
-            raw = response.read().decode("utf-8")
+            raw = response.read()
     except urllib.error.HTTPError as exc:
         detail = exc.read().decode("utf-8", errors="ignore") if exc.fp else ""
         raise RuntimeError(f"Ollama HTTP error {exc.code}: {detail or exc.reason}") from exc
@@ -76,8 +95,8 @@ def fetch_models(base_url: str, timeout: float = 10.0) -> list:
         raise RuntimeError(f"Cannot reach Ollama: {exc}") from exc
 
     try:
-        body = json.loads(raw)
-    except json.JSONDecodeError as exc:
+        body = _json_decode(raw)
+    except ValueError as exc:
         raise RuntimeError(f"Ollama returned invalid JSON: {exc}") from exc
 
     models = body.get("models")
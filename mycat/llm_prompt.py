@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import atexit
 import configparser
+import functools
 import logging
 import os
 import re
@@ -19,7 +21,10 @@ APP_NAME = "mycat"  # kept for backward-compat: exported in __all__
 CFG_DIR = paths.config_dir()
 CFG_FILE = paths.config_file()
 HISTORY_FILE = CFG_DIR / "history.txt"
-PROMPT_TEMPLATE_PATH = Path(__file__).resolve().parent / "PROMPT.j2"
+# Resolved once at import — resolve() hits the filesystem for realpath.
+MODULE_DIR = Path(__file__).resolve().parent
+REPO_ROOT = MODULE_DIR.parent
+PROMPT_TEMPLATE_PATH = MODULE_DIR / "PROMPT.j2"
 HISTORY_MAX_BYTES = 1_000_000
 
 DEFAULT_PROMPT_TEMPLATE = """You are a cute, affectionate talking cat belonging to a girl.
@@ -29,9 +34,16 @@ Recent conversation (latest {{history_count}} messages):
 Stay warm, playful, and loving when you reply."""
 
 ENV_LOADED = False
-PROMPT_TEMPLATE_CACHE: str | None = None
 
-HISTORY_HEADER_RE = re.compile(r"^\[(?P<timestamp>.+?)\]\s+(?P<label>REQUEST|RESPONSE):$")
+# Tolerates surrounding whitespace (including the trailing newline) so it can
+# run on raw file lines without a per-line .strip() allocation first.
+HISTORY_HEADER_RE = re.compile(r"^\s*\[(?P<timestamp>.+?)\]\s+(?P<label>REQUEST|RESPONSE):\s*$")
+
+# One pass per .env line: KEY=value with optional single/double quotes and an
+# optional trailing comment. Comments and blank lines simply fail to match.
+ENV_LINE_RE = re.compile(
+    r"""^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^#\n]*?))\s*(?:#.*)?$"""
+)
 
 
 @dataclass
@@ -56,19 +68,11 @@ def load_env_file() -> None:
     def apply_env(path: Path) -> None:
         try:
             for raw_line in path.read_text(encoding="utf-8").splitlines():
-                line = raw_line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if "#" in line:
-                    line = line.split("#", 1)[0].strip()
-                if "=" not in line:
-                    continue
-                key, value = line.split("=", 1)
-                key = key.strip()
-                if not key:
-                    continue
-                value = value.strip().strip('"').strip("'")
-                os.environ.setdefault(key, value)
+                match = ENV_LINE_RE.match(raw_line)
+                if not match:
+                    continue  # blank line, comment, or not KEY=value
+                value = next(group for group in match.group(2, 3, 4) if group is not None)
+                os.environ.setdefault(match.group(1), value)
             logger.debug("Loaded env values from %s", path)
         except OSError as exc:
             logger.debug("Unable to read env file %s: %s", path, exc)
@@ -78,17 +82,54 @@ def load_env_file() -> None:
     if override_path:
         candidates.append(Path(override_path).expanduser())
     candidates.append(Path.cwd() / ".env")
-    candidates.append(Path(__file__).resolve().parent.parent / ".env")
+    candidates.append(REPO_ROOT / ".env")
 
     seen: set[Path] = set()
     for candidate in candidates:
-        candidate = candidate.resolve()
+        candidate = candidate.absolute()
         if candidate in seen or not candidate.exists():
             continue
         seen.add(candidate)
         apply_env(candidate)
 
 
+# Parsed config.ini, cached per (path, mtime, size) — the settings are read on
+# several paths (chat send, settings dialogs, enabled checks) and re-running
+# configparser over an unchanged file each time is pure waste. Saves go through
+# the writers below, which bump the mtime and invalidate the cache naturally.
+_CONFIG_CACHE: tuple[tuple[str, int, int], configparser.ConfigParser] | None = None
+
+
+def _read_config() -> configparser.ConfigParser | None:
+    """The parsed config.ini, re-read only when the file changed on disk.
+
+    Returns None when the file is missing or unparseable. The returned parser
+    is shared — callers must treat it as read-only.
+    """
+    global _CONFIG_CACHE
+    try:
+        stat_result = CFG_FILE.stat()
+    except OSError:
+        return None
+    key = (str(CFG_FILE), stat_result.st_mtime_ns, stat_result.st_size)
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == key:
+        return _CONFIG_CACHE[1]
+    parser = configparser.ConfigParser()
+    try:
+        parser.read(CFG_FILE)
+    except configparser.Error as exc:
+        logger.warning("Unable to parse %s: %s", CFG_FILE, exc)
+        return None
+    _CONFIG_CACHE = (key, parser)
+    return parser
+
+
+def clear_config_cache() -> None:
+    """Forget the cached config.ini parse (tests repoint CFG_FILE under us)."""
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = None
+
+
 def load_llm_settings() -> LLMSettings:
     """Merge values from environment variables and config.ini into a single settings object."""
     settings = LLMSettings(
@@ -101,14 +142,7 @@ def load_llm_settings() -> LLMSettings:
         history_messages=int(os.getenv("LLM_HISTORY_MESSAGES", "10")),
     )
 
-    parser = configparser.ConfigParser()
-    if CFG_FILE.exists():
-        try:
-            parser.read(CFG_FILE)
-        except configparser.Error as exc:
-            logger.warning("Unable to parse %s: %s", CFG_FILE, exc)
-            parser = None  # type: ignore[assignment]
-
+    parser = _read_config()
     if parser:
         if parser.has_section("openai"):
             settings.openai_api_key = parser.get("openai", "api_key", fallback=settings.openai_api_key)
@@ -174,13 +208,11 @@ def load_llm_enabled() -> bool:
     """
     env_value = (os.getenv("LLM_ENABLED") or "").strip().lower()
     enabled = True if env_value == "" else env_value not in {"0", "false", "off", "no"}
-    if CFG_FILE.exists():
-        parser = configparser.ConfigParser()
+    parser = _read_config()
+    if parser is not None and parser.has_option("llm", "enabled"):
         try:
-            parser.read(CFG_FILE)
-            if parser.has_option("llm", "enabled"):
-                enabled = parser.getboolean("llm", "enabled")
-        except (configparser.Error, ValueError) as exc:
+            enabled = parser.getboolean("llm", "enabled")
+        except ValueError as exc:
             logger.warning("Unable to read LLM enabled flag: %s", exc)
     return enabled
 
@@ -220,6 +252,7 @@ def rotate_history_if_needed(path: Path, max_bytes: int = HISTORY_MAX_BYTES) ->
                 backup.unlink()
         except OSError as exc:
             logger.debug("Unable to remove old history backup %s: %s", backup, exc)
+        _close_history_handle()
         path.replace(backup)
         path.touch()
         restrict_permissions(path)
@@ -228,8 +261,8 @@ def rotate_history_if_needed(path: Path, max_bytes: int = HISTORY_MAX_BYTES) ->
         logger.warning("Unable to rotate history file %s: %s", path, exc)
 
 
-def parse_history_file(path: Path) -> list[tuple[str, str, str]]:
-    """Parse history file into structured messages."""
+def _parse_history_lines(lines) -> list[tuple[str, str, str]]:
+    """Parse an iterable of history-file lines into structured messages."""
     entries: list[tuple[str, str, str]] = []
     role: str | None = None
     timestamp: str | None = None
@@ -243,36 +276,124 @@ def parse_history_file(path: Path) -> list[tuple[str, str, str]]:
         timestamp = None
         buffer = []
 
+    for raw_line in lines:
+        match = HISTORY_HEADER_RE.match(raw_line)
+        if match:
+            flush()
+            role = "user" if match.group("label") == "REQUEST" else "cat"
+            timestamp = match.group("timestamp").strip()
+        else:
+            buffer.append(raw_line.rstrip("\n"))
+    flush()
+    return entries
+
+
+def parse_history_file(path: Path) -> list[tuple[str, str, str]]:
+    """Parse history file into structured messages."""
     try:
         with path.open("r", encoding="utf-8") as handle:
-            for raw_line in handle:
-                line = raw_line.rstrip("\n")
-                match = HISTORY_HEADER_RE.match(line.strip())
-                if match:
-                    flush()
-                    ts = match.group("timestamp").strip()
-                    label = match.group("label").upper()
-                    role = "user" if label == "REQUEST" else "cat"
-                    timestamp = ts
-                else:
-                    buffer.append(line)
-        flush()
+            return _parse_history_lines(handle)
     except OSError as exc:
         logger.debug("Unable to read history file %s: %s", path, exc)
+        return []
 
-    return entries
+
+# One long-lived append handle instead of an open/close syscall triplet per
+# message. Keyed by path (tests and the temp-file fallback swap it); rotation
+# closes it so the replace is never done under an open descriptor.
+_HISTORY_HANDLE: tuple[Path, object] | None = None
+
+
+def _close_history_handle() -> None:
+    global _HISTORY_HANDLE
+    if _HISTORY_HANDLE is not None:
+        try:
+            _HISTORY_HANDLE[1].close()
+        except OSError:
+            pass
+        _HISTORY_HANDLE = None
+
+
+atexit.register(_close_history_handle)
+
+
+def _history_handle(path: Path):
+    global _HISTORY_HANDLE
+    if _HISTORY_HANDLE is not None and _HISTORY_HANDLE[0] == path:
+        return _HISTORY_HANDLE[1]
+    _close_history_handle()
+    handle = path.open("a", encoding="utf-8")
+    _HISTORY_HANDLE = (path, handle)
+    return handle
+
+
+def append_history_entries(path: Path, entries: list[tuple[str, str, str]]) -> None:
+    """Append several (role, text, timestamp) messages in one buffered write."""
+    if not entries:
+        return
+    rotate_history_if_needed(path)
+    blocks = []
+    for role, text, timestamp in entries:
+        label = "REQUEST" if role == "user" else "RESPONSE"
+        blocks.append(f"[{timestamp}] {label}:\n{text}\n")
+    try:
+        handle = _history_handle(path)
+        handle.write("".join(blocks))
+        handle.flush()
+    except (OSError, ValueError) as exc:
+        _close_history_handle()
+        logger.debug("Unable to write history entries: %s", exc)
 
 
 def append_history_entry(path: Path, role: str, text: str, timestamp: str) -> None:
     """Append a single message to the history file."""
-    rotate_history_if_needed(path)
-    label = "REQUEST" if role == "user" else "RESPONSE"
-    block = f"[{timestamp}] {label}:\n{text}\n"
+    append_history_entries(path, [(role, text, timestamp)])
+
+
+# get_history_tail parses the whole file only while it is small; above this
+# size it seeks to the end and reads back block by block, so the per-prompt
+# cost stays bound by `limit`, not by months of accumulated history.
+HISTORY_TAIL_FULL_PARSE_MAX = 64 * 1024
+HISTORY_TAIL_BLOCK = 4096
+
+
+def _parse_tail_entries(path: Path, size: int, limit: int) -> list[tuple[str, str, str]]:
+    """Parse only the end of a large history file.
+
+    Reads backwards from EOF in blocks until more than `limit` message headers
+    are in the buffer, then parses just that tail. An entry whose header lies
+    before the buffer start would be truncated, so it is dropped.
+    """
+    header_marks = (b"] REQUEST:", b"] RESPONSE:")
+    buffer = b""
+    position = size
     try:
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(block)
+        with path.open("rb") as handle:
+            while position > 0:
+                step = min(HISTORY_TAIL_BLOCK, position)
+                position -= step
+                handle.seek(position)
+                buffer = handle.read(step) + buffer
+                if sum(buffer.count(mark) for mark in header_marks) > limit:
+                    break
     except OSError as exc:
-        logger.debug("Unable to write history entry: %s", exc)
+        logger.debug("Unable to read history file %s: %s", path, exc)
+        return []
+    lines = buffer.decode("utf-8", errors="replace").splitlines()
+    entries = _parse_history_lines(lines)
+    if position > 0 and entries:
+        entries = entries[1:]
+    return entries
+
+
+def serialize_history_entries(entries: list[tuple[str, str, str]]) -> list[str]:
+    """Serialise (role, text, timestamp) messages back to history-file lines."""
+    out: list[str] = []
+    for role, text, ts in entries:
+        label = "REQUEST" if role == "user" else "RESPONSE"
+        out.append(f"[{ts}] {label}:")
+        out.extend(text.splitlines() or [""])
+    return out
 
 
 def get_history_tail(history_path: Path, limit: int) -> list[str]:
@@ -283,16 +404,30 @@ def get_history_tail(history_path: Path, limit: int) -> list[str]:
     """
     if limit <= 0:
         return []
-    entries = parse_history_file(history_path)
+    try:
+        size = history_path.stat().st_size
+    except OSError:
+        return []
+    if size > HISTORY_TAIL_FULL_PARSE_MAX:
+        entries = _parse_tail_entries(history_path, size, limit)
+    else:
+        entries = parse_history_file(history_path)
     if not entries:
         return []
-    tail = entries[-limit:]
-    out: list[str] = []
-    for role, text, ts in tail:
-        label = "REQUEST" if role == "user" else "RESPONSE"
-        out.append(f"[{ts}] {label}:")
-        out.extend(text.splitlines() or [""])
-    return out
+    return serialize_history_entries(entries[-limit:])
+
+
+def get_history_tail_from_memory(
+    messages: list[tuple[str, str, str]], limit: int
+) -> list[str]:
+    """Like :func:`get_history_tail`, but from already-parsed messages.
+
+    The chat dialog holds the full conversation in memory, so building the
+    prompt context from it skips the per-send file read and parse entirely.
+    """
+    if limit <= 0 or not messages:
+        return []
+    return serialize_history_entries(messages[-limit:])
 
 
 PLACEHOLDER_RE = re.compile(r"\{\{\s*(date|history|history_count)\s*\}\}")
@@ -315,19 +450,23 @@ def render_prompt(history_lines: list[str], history_limit: int) -> str:
     return PLACEHOLDER_RE.sub(lambda m: values[m.group(1)], template)
 
 
+@functools.lru_cache(maxsize=4)
+def _read_template(path_str: str, mtime_ns: int) -> str:
+    template = Path(path_str).read_text(encoding="utf-8")
+    logger.debug("Loaded prompt template from %s", path_str)
+    return template
+
+
 def load_prompt_template() -> str:
-    global PROMPT_TEMPLATE_CACHE
-    if PROMPT_TEMPLATE_CACHE is not None:
-        return PROMPT_TEMPLATE_CACHE
-    if PROMPT_TEMPLATE_PATH.exists():
-        try:
-            PROMPT_TEMPLATE_CACHE = PROMPT_TEMPLATE_PATH.read_text(encoding="utf-8")
-            logger.debug("Loaded prompt template from %s", PROMPT_TEMPLATE_PATH)
-            return PROMPT_TEMPLATE_CACHE
-        except OSError as exc:
+    """The prompt template, cached per (path, mtime) so edits are picked up
+    on the next render while the steady state stays a dict lookup."""
+    try:
+        stat_result = PROMPT_TEMPLATE_PATH.stat()
+        return _read_template(str(PROMPT_TEMPLATE_PATH), stat_result.st_mtime_ns)
+    except OSError as exc:
+        if not isinstance(exc, FileNotFoundError):
             logger.warning("Unable to read %s: %s", PROMPT_TEMPLATE_PATH, exc)
-    PROMPT_TEMPLATE_CACHE = DEFAULT_PROMPT_TEMPLATE
-    return PROMPT_TEMPLATE_CACHE
+        return DEFAULT_PROMPT_TEMPLATE
 
 
 __all__ = [
@@ -343,7 +482,9 @@ __all__ = [
     "ensure_history_file",
     "parse_history_file",
     "append_history_entry",
+    "append_history_entries",
     "get_history_tail",
+    "get_history_tail_from_memory",
     "render_prompt",
     "rotate_history_if_needed",
 ]
@@ -17,6 +17,59 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The controller's event filter sees every event on the cat window; anything
+# outside this set returns immediately via one C-level membership test.
+_ANCHOR_EVENTS = frozenset({QtCore.QEvent.Type.Move, QtCore.QEvent.Type.Resize})
+
+# Stylesheets for the per-message / per-tick paths are built once here; every
+# setStyleSheet call makes Qt re-parse the CSS, so the hot paths reuse these
+# frozen strings instead of formatting new ones.
+_USER_FRAME_CSS = "QFrame { background-color: #e0f5e0; border: none; }"
+_CAT_FRAME_CSS = "QFrame { background-color: #e0ebff; border: none; }"
+_HEADER_CSS = "font-size: 13px; color: #1c1c1c;"
+_BODY_NORMAL_CSS = "font-size: 13px; color: #1c1c1c; background: transparent;"
+_BODY_DIM_CSS = "font-size: 13px; color: rgba(28,28,28,0.4);"
+_TYPING_BRIGHT_CSS = "font-size: 14px; color: rgba(28,28,28,1.0);"
+_TYPING_DIM_CSS = "font-size: 14px; color: rgba(28,28,28,0.5);"
+_WELCOME_CSS = "color: #888; font-style: italic; margin-top: 40px;"
+_BUTTON_CSS = """
+    QPushButton {
+        background-color: #dfdfdf;
+        border: 1px solid #b0b0b0;
+        border-radius: 0;
+        padding: 0 5px;
+        min-width: 32px;
+    }
+    QPushButton:hover {
+        background-color: #cecece;
+    }
+    QPushButton:pressed {
+        background-color: #bdbdbd;
+    }
+"""
+_INPUT_CSS = """
+    QLineEdit {
+        background-color: white;
+        color: #1c1c1c;
+        selection-color: white;
+        selection-background-color: #4a90e2;
+        border: 1px solid #b0b0b0;
+        border-radius: 0;
+        padding-left: 10px;
+        padding-right: 10px;
+        font-size: 13px;
+    }
+    QLineEdit:focus {
+        border-color: #8a8a8a;
+    }
+"""
+
+# A bubble is a real QWidget, so the widget count (and every layout/resize
+# pass over them) must stay bounded even when months of history are on disk.
+# Only this many of the newest messages get bubbles; the full conversation
+# stays in ChatDialog.messages for prompt context and persistence.
+MAX_RENDERED_MESSAGES = 200
+
 
 def attach_chat(window: QtWidgets.QWidget, context: LLMContext, enabled: bool = True) -> None:
     controller = LLMController(window, context, enabled=enabled)
@@ -37,16 +90,33 @@ class LLMController(QtCore.QObject):
         self.enabled = enabled
         self.chat_dialog: ChatDialog | None = None
         self.history_file = llm_prompt.ensure_history_file()
+        # Dedicated one-thread pool: a single in-flight request matches the
+        # waiting_for_response invariant, and chat work never competes with
+        # whatever else sits in Qt's global pool.
+        self.llm_pool = QtCore.QThreadPool(self)
+        self.llm_pool.setMaxThreadCount(1)
+        self.llm_pool.setExpiryTimeout(30_000)
+        # Anchor passes are debounced to one per frame; dialog move/resize
+        # events just restart this timer, and moving the dialog to the spot it
+        # already occupies is a no-op, so the loop settles by itself.
+        self.reanchor_timer = QtCore.QTimer(self)
+        self.reanchor_timer.setSingleShot(True)
+        self.reanchor_timer.setInterval(16)
+        self.reanchor_timer.timeout.connect(self.position_dialog_now)
+        # Separate one-thread pool for history I/O: reads and writes stay
+        # ordered on a single worker and never queue behind a slow LLM call.
+        self.io_pool = QtCore.QThreadPool(self)
+        self.io_pool.setMaxThreadCount(1)
+        self.io_pool.setExpiryTimeout(30_000)
 
         window.installEventFilter(self)
         window.destroyed.connect(self.on_window_destroyed)
         logger.debug("LLM controller initialised with history file %s", self.history_file)
 
     def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
-        if watched is self.window and event.type() in (
-            QtCore.QEvent.Type.Move,
-            QtCore.QEvent.Type.Resize,
-        ):
+        if event.type() not in _ANCHOR_EVENTS:
+            return False
+        if watched is self.window:
             self.position_dialog()
         return super().eventFilter(watched, event)
 
@@ -62,7 +132,7 @@ class LLMController(QtCore.QObject):
                 return
             logger.debug("Showing existing chat dialog")
             self.chat_dialog.show()
-            self.position_dialog()
+            self.position_dialog_now()
             self.chat_dialog.raise_()
             self.chat_dialog.activateWindow()
             return
@@ -72,7 +142,7 @@ class LLMController(QtCore.QObject):
         dialog.show()
         dialog.destroyed.connect(self.on_chat_destroyed)
         self.chat_dialog = dialog
-        self.position_dialog()
+        self.position_dialog_now()
 
     def is_enabled(self) -> bool:
         return self.enabled
@@ -88,6 +158,9 @@ class LLMController(QtCore.QObject):
         return self.enabled
 
     def position_dialog(self) -> None:
+        self.reanchor_timer.start()
+
+    def position_dialog_now(self) -> None:
         if not self.chat_dialog:
             return
         screen_rect = QtGui.QGuiApplication.primaryScreen().availableGeometry()
@@ -107,16 +180,21 @@ class LLMController(QtCore.QObject):
         if x + dialog_width > screen_rect.width():
             x = screen_rect.width() - dialog_width - 10
 
-        dialog.suspend_anchor = True  # type: ignore[attr-defined]
         dialog.move(x, y)
-        dialog.suspend_anchor = False  # type: ignore[attr-defined]
 
     def on_chat_destroyed(self, *_args) -> None:
         logger.debug("Chat dialog destroyed")
         self.chat_dialog = None
 
     def on_window_destroyed(self, *_args) -> None:
+        self.llm_pool.clear()  # drop runnables still queued behind the active one
+        if self.chat_dialog is not None:
+            try:
+                self.chat_dialog.flush_history()
+            except RuntimeError:
+                pass  # dialog already torn down with the window
         self.chat_dialog = None
+        self.io_pool.waitForDone(1000)  # let the final history flush land
 
 
 class ChatDialog(QtWidgets.QDialog):
@@ -130,12 +208,22 @@ class ChatDialog(QtWidgets.QDialog):
         self.history_file = controller.history_file
         self.message_count = 0
         self.waiting_for_response = False
-        self.thread_pool = QtCore.QThreadPool.globalInstance()
+        self.thread_pool = controller.llm_pool
         self.pending_worker: LLMWorker | None = None
         self.pending_request_started: float | None = None
         self.pending_request_text: str | None = None
-        self.suspend_anchor = False
         self.messages: list[tuple[str, str, str]] = []
+        # Live bubbles, in layout order — iterating this plain list is much
+        # cheaper than querying the layout (itemAt/widget are Qt calls each).
+        self.bubbles: list[MessageBubble] = []
+        self.last_max_width = -1
+        # History writes are buffered and flushed in one append shortly after
+        # the conversation goes quiet, instead of one write per message.
+        self.pending_writes: list[tuple[str, str, str]] = []
+        self.flush_timer = QtCore.QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(500)
+        self.flush_timer.timeout.connect(self.flush_history)
 
         self.setWindowFlags(
             QtCore.Qt.WindowType.Window
@@ -171,56 +259,31 @@ class ChatDialog(QtWidgets.QDialog):
         self.messages_layout.setSpacing(4)
         self.messages_layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignBottom)
         self.scroll_area.setWidget(self.messages_widget)
+        # One debounced timer coalesces all scroll requests (new message,
+        # range change, typing indicator) into a single pass per event-loop
+        # turn instead of stacking singleShot callbacks.
+        self.scroll_timer = QtCore.QTimer(self)
+        self.scroll_timer.setSingleShot(True)
+        self.scroll_timer.setInterval(16)
+        self.scroll_timer.timeout.connect(self.scroll_to_bottom)
         self.scroll_area.verticalScrollBar().rangeChanged.connect(
-            lambda *_: QtCore.QTimer.singleShot(0, self.scroll_to_bottom)
+            lambda *_: self.schedule_scroll()
         )
 
         input_layout = QtWidgets.QHBoxLayout()
         input_layout.setContentsMargins(0, 0, 0, 0)
         input_layout.setSpacing(2)
 
-        button_style = """
-            QPushButton {
-                background-color: #dfdfdf;
-                border: 1px solid #b0b0b0;
-                border-radius: 0;
-                padding: 0 5px;
-                min-width: 32px;
-            }
-            QPushButton:hover {
-                background-color: #cecece;
-            }
-            QPushButton:pressed {
-                background-color: #bdbdbd;
-            }
-        """
         self.input_field = QtWidgets.QLineEdit()
         self.input_field.setPlaceholderText("Write a message…")
         self.input_field.setMinimumHeight(34)
-        self.input_field.setStyleSheet(
-            """
-            QLineEdit {
-                background-color: white;
-                color: #1c1c1c;
-                selection-color: white;
-                selection-background-color: #4a90e2;
-                border: 1px solid #b0b0b0;
-                border-radius: 0;
-                padding-left: 10px;
-                padding-right: 10px;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border-color: #8a8a8a;
-            }
-        """
-        )
+        self.input_field.setStyleSheet(_INPUT_CSS)
         input_layout.addWidget(self.input_field, 1)
 
         self.send_button = QtWidgets.QPushButton("Send")
         self.send_button.setMinimumHeight(34)
         self.send_button.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
-        self.send_button.setStyleSheet(button_style)
+        self.send_button.setStyleSheet(_BUTTON_CSS)
         self.send_button.setDefault(True)
         self.send_button.setAutoDefault(True)
         self.send_button.clicked.connect(self.send_message)
@@ -231,37 +294,52 @@ class ChatDialog(QtWidgets.QDialog):
         self.typing_indicator: TypingIndicator | None = None
 
     def load_history(self) -> None:
-        entries = llm_prompt.parse_history_file(self.history_file)
+        """Parse the history file off the UI thread; render when it arrives.
+
+        The dialog opens immediately (with the welcome label as placeholder)
+        instead of stalling on I/O and parsing of a possibly large file.
+        """
+        self.show_welcome_message()
+        loader = HistoryLoader(self.history_file)
+        loader.signals.loaded.connect(self.on_history_loaded)
+        self.controller.io_pool.start(loader)
+
+    def on_history_loaded(self, entries: list) -> None:
+        if self.messages:
+            # Messages sent while the load was still running stay at the end.
+            entries = entries + self.messages
         self.messages = entries
         self.message_count = len(entries)
         logger.debug("Loaded %d history entries", self.message_count)
-        self.render_messages()
+        self.render_all()
 
     def show_welcome_message(self) -> None:
         self.messages = []
         self.clear_message_widgets()
         label = QtWidgets.QLabel("Write something...")
         label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet("color: #888; font-style: italic; margin-top: 40px;")
+        label.setStyleSheet(_WELCOME_CSS)
         self.messages_layout.addWidget(label)
         self.message_count = 0
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self.flush_history()
         if self.controller.window.isVisible():
             event.ignore()
             self.hide()
         else:
+            if self.pending_worker is not None:
+                self.pending_worker.abort()
             super().closeEvent(event)
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         super().resizeEvent(event)
-        if not getattr(self, "suspend_anchor", False):
-            self.controller.position_dialog()
+        self.update_bubble_widths()
+        self.controller.position_dialog()
 
     def moveEvent(self, event: QtGui.QMoveEvent) -> None:
         super().moveEvent(event)
-        if not getattr(self, "suspend_anchor", False):
-            self.controller.position_dialog()
+        self.controller.position_dialog()
 
     def send_message(self) -> None:
         text = self.input_field.text().strip()
@@ -269,7 +347,6 @@ class ChatDialog(QtWidgets.QDialog):
             return
         logger.info("Request: %s", text)
         self.append_message("user", text)
-        QtCore.QTimer.singleShot(0, self.scroll_to_bottom)
         self.input_field.clear()
         self.set_input_enabled(False)
         self.waiting_for_response = True
@@ -278,7 +355,11 @@ class ChatDialog(QtWidgets.QDialog):
         self.schedule_scroll()
 
     def request_ai_response(self, text: str) -> None:
-        history_lines = llm_prompt.get_history_tail(self.history_file, self.settings.history_messages)
+        # The dialog already holds the parsed conversation, so build the prompt
+        # context from memory instead of re-reading the history file every send.
+        history_lines = llm_prompt.get_history_tail_from_memory(
+            self.messages, self.settings.history_messages
+        )
         system_prompt = llm_prompt.render_prompt(history_lines, self.settings.history_messages)
         self.pending_request_started = time.monotonic()
         self.pending_request_text = text
@@ -301,11 +382,14 @@ class ChatDialog(QtWidgets.QDialog):
         self.log_request_summary(message, success=False)
 
     def on_ai_finished(self) -> None:
+        worker = self.pending_worker
         self.pending_worker = None
         self.waiting_for_response = False
-        self.set_input_enabled(True)
         self.pending_request_started = None
         self.pending_request_text = None
+        if worker is not None and worker.aborted:
+            return  # dialog is closing; leave the widgets alone
+        self.set_input_enabled(True)
         self.hide_typing_indicator()
 
     def set_input_enabled(self, enabled: bool) -> None:
@@ -320,32 +404,57 @@ class ChatDialog(QtWidgets.QDialog):
         persist: bool = True,
     ) -> None:
         timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        if self.message_count == 0:
-            self.messages = []
+        had_messages = bool(self.messages)
         self.messages.append((role, text, timestamp))
         self.message_count = len(self.messages)
-        self.render_messages()
+        if not had_messages:
+            self.clear_message_widgets()  # drop the welcome label
+        self.append_bubble(role, text)
+        self.schedule_scroll()
         if persist:
-            llm_prompt.append_history_entry(self.history_file, role, text, timestamp)
+            self.pending_writes.append((role, text, timestamp))
+            self.flush_timer.start()
+
+    def flush_history(self) -> None:
+        if not self.pending_writes:
+            return
+        entries, self.pending_writes = self.pending_writes, []
+        self.controller.io_pool.start(HistoryWriter(self.history_file, entries))
+
+    def render_all(self) -> None:
+        """Rebuild every bubble — initial load and clear-history paths only.
 
-    def render_messages(self) -> None:
+        Per-message updates go through append_bubble, which adds a single
+        widget instead of tearing the whole list down.
+        """
         if not self.messages:
             self.show_welcome_message()
             return
 
         self.clear_message_widgets()
-        for role, text, _timestamp in self.messages:
+        for role, text, _timestamp in self.messages[-MAX_RENDERED_MESSAGES:]:
             bubble = MessageBubble(role, text)
             self.messages_layout.addWidget(bubble, alignment=bubble.alignment_flag)
+            self.bubbles.append(bubble)
         self.schedule_scroll()
         self.update_bubble_widths()
 
+    def append_bubble(self, role: str, text: str) -> None:
+        bubble = MessageBubble(role, text)
+        self.messages_layout.addWidget(bubble, alignment=bubble.alignment_flag)
+        self.bubbles.append(bubble)
+        bubble.set_max_width(self.current_max_width())
+
+    def current_max_width(self) -> int:
+        return max(100, int(self.scroll_area.viewport().width() * 0.85))
+
     def clear_message_widgets(self) -> None:
         while self.messages_layout.count():
             item = self.messages_layout.takeAt(0)
             widget = item.widget()
             if widget:
                 widget.deleteLater()
+        self.bubbles.clear()
         self.typing_indicator = None
 
     def show_typing_indicator(self) -> None:
@@ -370,18 +479,20 @@ class ChatDialog(QtWidgets.QDialog):
         self.update_bubble_widths()
 
     def schedule_scroll(self) -> None:
-        QtCore.QTimer.singleShot(0, self.scroll_to_bottom)
-        QtCore.QTimer.singleShot(60, self.scroll_to_bottom)
+        if not self.scroll_timer.isActive():
+            self.scroll_timer.start()
 
     def update_bubble_widths(self) -> None:
         viewport = self.scroll_area.viewport()
-        max_width = max(100, int(viewport.width() * 0.85))
-        for index in range(self.messages_layout.count()):
-            item = self.messages_layout.itemAt(index)
-            widget = item.widget()
-            if isinstance(widget, MessageBubble):
-                widget.set_max_width(max_width)
         self.messages_widget.setMinimumHeight(viewport.height())
+        max_width = self.current_max_width()
+        # Scroll passes call this constantly; only walk the bubbles when the
+        # viewport width actually changed (resize, scrollbar appearing).
+        if max_width == self.last_max_width:
+            return
+        self.last_max_width = max_width
+        for bubble in self.bubbles:
+            bubble.set_max_width(max_width)
 
     def log_request_summary(self, response: str, success: bool) -> None:
         if self.pending_request_started is None or self.pending_request_text is None:
@@ -396,6 +507,34 @@ class ChatDialog(QtWidgets.QDialog):
             logger.error("error: %s (%.2fs)", json.dumps(response, ensure_ascii=False), duration)
 
 
+class HistoryWriter(QtCore.QRunnable):
+    """Writes a batch of buffered history entries off the UI thread."""
+
+    def __init__(self, history_file, entries: list[tuple[str, str, str]]) -> None:
+        super().__init__()
+        self.history_file = history_file
+        self.entries = entries
+
+    def run(self) -> None:
+        llm_prompt.append_history_entries(self.history_file, self.entries)
+
+
+class HistoryLoaderSignals(QtCore.QObject):
+    loaded = QtCore.Signal(list)
+
+
+class HistoryLoader(QtCore.QRunnable):
+    """Parses the chat history file off the UI thread."""
+
+    def __init__(self, history_file) -> None:
+        super().__init__()
+        self.history_file = history_file
+        self.signals = HistoryLoaderSignals()
+
+    def run(self) -> None:
+        self.signals.loaded.emit(llm_prompt.parse_history_file(self.history_file))
+
+
 class LLMWorkerSignals(QtCore.QObject):
     """Qt signals emitted by the background worker."""
     result = QtCore.Signal(str)
@@ -410,15 +549,25 @@ class LLMWorker(QtCore.QRunnable):
         self.backend = backend
         self.user_text = user_text
         self.system_prompt = system_prompt
+        self.aborted = False
         self.signals = LLMWorkerSignals()
 
+    def abort(self) -> None:
+        """Cooperative cancel: suppress result/error signals for this request."""
+        self.aborted = True
+        backend_abort = getattr(self.backend, "abort", None)
+        if backend_abort is not None:
+            backend_abort()
+
     def run(self) -> None:
         try:
             answer = self.backend.reply(self.user_text, self.system_prompt)
         except Exception as exc:  # pragma: no cover
-            self.signals.error.emit(str(exc))
+            if not self.aborted:
+                self.signals.error.emit(str(exc))
         else:
-            self.signals.result.emit(answer)
+            if not self.aborted:
+                self.signals.result.emit(answer)
         finally:
             self.signals.finished.emit()
 
@@ -441,15 +590,7 @@ class MessageBubble(QtWidgets.QWidget):
 
         self.frame = QtWidgets.QFrame()
         self.frame.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        color = "#e0f5e0" if role == "user" else "#e0ebff"
-        self.frame.setStyleSheet(
-            f"""
-            QFrame {{
-                background-color: {color};
-                border: none;
-            }}
-            """
-        )
+        self.frame.setStyleSheet(_USER_FRAME_CSS if role == "user" else _CAT_FRAME_CSS)
         self.frame.setSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
         inner = QtWidgets.QVBoxLayout(self.frame)
         inner.setContentsMargins(6, 4, 6, 4)
@@ -457,13 +598,13 @@ class MessageBubble(QtWidgets.QWidget):
 
         header = QtWidgets.QLabel("Request" if role == "user" else "Response")
         header.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft)
-        header.setStyleSheet("font-size: 13px; color: #1c1c1c;")
+        header.setStyleSheet(_HEADER_CSS)
 
         body = QtWidgets.QLabel(text.replace("\r\n", "\n"))
         body.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft)
         body.setWordWrap(True)
         body.setTextFormat(QtCore.Qt.TextFormat.PlainText)
-        body.setStyleSheet("font-size: 13px; color: #1c1c1c; background: transparent;")
+        body.setStyleSheet(_BODY_NORMAL_CSS)
         body.setSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
 
         inner.addWidget(header)
@@ -471,21 +612,31 @@ class MessageBubble(QtWidgets.QWidget):
         layout.addWidget(self.frame)
 
         self.body_label = body
-        self.opacity_timer = QtCore.QTimer(self)
-        self.opacity_timer.setSingleShot(True)
-        self.opacity_timer.timeout.connect(self.restore_opacity)
+        self.applied_width = -1
+        # Created on first click only — most bubbles are never clicked, and a
+        # QTimer per bubble is a live QObject in the event loop for each one.
+        self.opacity_timer: QtCore.QTimer | None = None
 
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
         if event.button() == QtCore.Qt.MouseButton.LeftButton:
             QtWidgets.QApplication.clipboard().setText(self.raw_text)
-            self.body_label.setStyleSheet("font-size: 13px; color: rgba(28,28,28,0.4);")
+            self.body_label.setStyleSheet(_BODY_DIM_CSS)
+            if self.opacity_timer is None:
+                self.opacity_timer = QtCore.QTimer(self)
+                self.opacity_timer.setSingleShot(True)
+                self.opacity_timer.timeout.connect(self.restore_opacity)
             self.opacity_timer.start(200)
         super().mousePressEvent(event)
 
     def restore_opacity(self) -> None:
-        self.body_label.setStyleSheet("font-size: 13px; color: #1c1c1c; background: transparent;")
+        self.body_label.setStyleSheet(_BODY_NORMAL_CSS)
 
     def set_max_width(self, width: int) -> None:
+        # Changing the label's width constraints makes QLabel re-wrap (a full
+        # text-shaping pass over the body); skip it when nothing changed.
+        if width == self.applied_width:
+            return
+        self.applied_width = width
         self.frame.setMaximumWidth(width)
         self.frame.setMinimumWidth(min(width, 200))
         max_body = max(50, width - 12)
@@ -504,33 +655,37 @@ class TypingIndicator(QtWidgets.QWidget):
         layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
 
         frame = QtWidgets.QFrame()
-        frame.setStyleSheet(
-            """
-            QFrame {
-                background-color: #e0ebff;
-                border: none;
-            }
-            """
-        )
+        frame.setStyleSheet(_CAT_FRAME_CSS)
         inner = QtWidgets.QHBoxLayout(frame)
         inner.setContentsMargins(12, 6, 12, 6)
         self.label = QtWidgets.QLabel("⋯")
-        self.label.setStyleSheet("font-size: 14px; color: #1c1c1c;")
+        self.label.setStyleSheet(_TYPING_BRIGHT_CSS)
         inner.addWidget(self.label)
         layout.addWidget(frame)
 
         self.phase = 0
+        self.current_css = _TYPING_BRIGHT_CSS
         self.timer = QtCore.QTimer(self)
         self.timer.timeout.connect(self.advance)
         self.timer.start(1000)
 
     def advance(self) -> None:
-        if self.phase < 3:
-            opacity = 1.0
-        else:
-            opacity = 0.5
-        self.label.setStyleSheet(f"font-size: 14px; color: rgba(28,28,28,{opacity});")
+        css = _TYPING_BRIGHT_CSS if self.phase < 3 else _TYPING_DIM_CSS
+        if css is not self.current_css:
+            self.current_css = css
+            self.label.setStyleSheet(css)
         self.phase = (self.phase + 1) % 4
 
+    # No point ticking while nothing is painted (dialog hidden during a long
+    # request); the animation pauses with the widget and resumes on show.
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        if not self.timer.isActive():
+            self.timer.start(1000)
+        super().showEvent(event)
+
 
 __all__ = ["attach_chat"]
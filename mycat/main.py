@@ -10,15 +10,20 @@ pip install PySide6
 """
 
 import argparse
+import bisect
 import configparser
 import getpass
+import hashlib
 import io
+import itertools
 import logging
 import math
 import os
 import random
 import shutil
 import signal
+import socket
+import struct
 import subprocess
 import sys
 import threading
@@ -70,6 +75,22 @@ else:
 
 from PySide6 import QtCore, QtGui, QtNetwork, QtWidgets
 
+# Pillow, imported once: the GIF-delay fallback and alpha hardening used an
+# in-function import, paying the sys.modules lookup (and a try/except) on
+# every call even with Pillow installed.
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+
+# psutil (optional): battery-level fallback where /sys has no battery info.
+# Imported once — battery_percent runs periodically in pack mode and paid the
+# sys.modules lookup on every poll.
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 # Make logs readable for non-ASCII text (Cyrillic, emoji): force UTF-8 on the
 # console streams when the locale left them as ASCII (otherwise the logger
 # escapes e.g. "Ты" to "Ты").
@@ -107,10 +128,57 @@ STATIC_TIME = 5.0  # Seconds to show static first frame before playing GIF
 DEFAULT_POSITION_OFFSET_X = 10  # Offset from right edge of screen
 DEFAULT_POSITION_OFFSET_Y = 10  # Offset from bottom edge of screen
 
+# Interactive-pack tick intervals (ms): ~30 fps while anything on screen can
+# move, a slow idle tick while the cat sleeps (held pose, no gaze tracking).
+PACK_TICK_ACTIVE_MS = 33
+PACK_TICK_SLEEP_MS = 250
+
+# How many recently used legacy chars keep their GIF bytes in memory (a few
+# hundred KB each) so switching back to them never touches the disk.
+CHAR_BYTES_CACHE_MAX = 8
+
+
+# Char-id scan cache: the context menu rebuilds the list on every open, which
+# re-globbed both chars dirs each time. The watcher keeps the "new zip shows up
+# instantly" behaviour — a directory change drops the cache for the next scan.
+_CHARS_CACHE: list[str] | None = None
+_CHARS_WATCHER: QtCore.QFileSystemWatcher | None = None
+
+
+def _invalidate_chars_cache(*_args) -> None:
+    global _CHARS_CACHE
+    _CHARS_CACHE = None
+
+
+def _watch_chars_dirs() -> None:
+    global _CHARS_WATCHER
+    if _CHARS_WATCHER is None:
+        if QtCore.QCoreApplication.instance() is None:
+            return
+        _CHARS_WATCHER = QtCore.QFileSystemWatcher()
+        _CHARS_WATCHER.directoryChanged.connect(_invalidate_chars_cache)
+    user_dir = char_catalog.user_chars_dir()
+    watched = set(_CHARS_WATCHER.directories())
+    # While the user dir doesn't exist yet, watch its parent so its creation
+    # (first shop download / manual drop) still invalidates the cache.
+    for directory in (user_dir if user_dir.exists() else user_dir.parent,
+                      char_catalog.bundled_chars_dir()):
+        path = str(directory)
+        if directory.exists() and path not in watched:
+            _CHARS_WATCHER.addPath(path)
+
 
 def scan_chars() -> list[str]:
-    """Return sorted unique char ids from bundled + user-installed locations."""
-    return char_catalog.scan_all()
+    """Return sorted unique char ids from bundled + user-installed locations.
+
+    Cached between calls; a QFileSystemWatcher on the chars dirs drops the
+    cache when anything changes, so fresh installs still appear immediately.
+    """
+    global _CHARS_CACHE
+    if _CHARS_CACHE is None:
+        _CHARS_CACHE = char_catalog.scan_all()
+    _watch_chars_dirs()
+    return list(_CHARS_CACHE)
 
 
 def movie_from_gif_bytes(gif_data: bytes) -> QtGui.QMovie:
@@ -129,19 +197,105 @@ def movie_from_gif_bytes(gif_data: bytes) -> QtGui.QMovie:
     return movie
 
 
+def decode_movie_frames(movie: QtGui.QMovie) -> list[QtGui.QPixmap]:
+    """Decode every frame of the movie once, in playback order.
+
+    jumpToFrame + currentPixmap on each animation tick re-renders the frame
+    through the GIF decoder; decoding the whole (already scaled) clip up front
+    turns the per-frame work into a plain list lookup on a ready-to-blit pixmap.
+    """
+    frames: list[QtGui.QPixmap] = []
+    for index in range(max(0, movie.frameCount())):
+        movie.jumpToFrame(index)
+        pixmap = movie.currentPixmap()
+        if not pixmap.isNull():
+            frames.append(pixmap)
+    return frames
+
+
+def scan_gif_frame_delays(gif_data: bytes) -> list[int]:
+    """Read per-frame delays straight from the GIF block structure.
+
+    Walks the byte buffer skipping image data (sub-block lengths only) and
+    picks the delay out of each Graphic Control Extension — no pixel is ever
+    decoded, unlike a Pillow seek over every frame.
+    """
+    if gif_data[:6] not in (b"GIF87a", b"GIF89a"):
+        raise ValueError("not a GIF header")
+    packed = gif_data[10]
+    offset = 13
+    if packed & 0x80:  # global color table follows the screen descriptor
+        offset += 3 * (2 << (packed & 0x07))
+
+    delays: list[int] = []
+    pending: int | None = None
+    while True:
+        block = gif_data[offset]
+        offset += 1
+        if block == 0x3B:  # trailer
+            break
+        if block == 0x21:  # extension: label, then length-prefixed sub-blocks
+            label = gif_data[offset]
+            offset += 1
+            if label == 0xF9:  # graphic control: delay is in 1/100 s
+                (pending,) = struct.unpack_from("<H", gif_data, offset + 2)
+                pending *= 10
+            while (length := gif_data[offset]) != 0:
+                offset += 1 + length
+            offset += 1
+        elif block == 0x2C:  # image descriptor -> one frame
+            delays.append(pending if pending is not None else 100)
+            pending = None
+            packed = gif_data[offset + 8]
+            offset += 9
+            if packed & 0x80:  # local color table
+                offset += 3 * (2 << (packed & 0x07))
+            offset += 1  # LZW minimum code size
+            while (length := gif_data[offset]) != 0:
+                offset += 1 + length
+            offset += 1
+        else:
+            raise ValueError(f"unknown GIF block 0x{block:02x} at {offset - 1}")
+    return delays
+
+
+# Parsed delays keyed by a digest of the GIF bytes: switching back to a
+# recently used image (or re-loading the current one) skips the re-parse.
+_DELAY_CACHE: dict[bytes, list[int]] = {}
+
+
 def parse_gif_frame_delays(gif_data: bytes) -> list[int]:
     """
-    Parse GIF bytes using Pillow to extract frame delays.
-    Returns list of delays in milliseconds.
+    Extract per-frame delays from GIF bytes (milliseconds per frame).
+
+    The block scan reads only headers; Pillow (which decodes every frame it
+    seeks over) is kept as a fallback for GIFs the scan chokes on. Results
+    are cached by content hash so repeated image switches are free.
     """
+    cache_key = hashlib.blake2b(gif_data, digest_size=16).digest()
+    cached = _DELAY_CACHE.get(cache_key)
+    if cached is not None:
+        return list(cached)
+
+    delays = _parse_gif_frame_delays_uncached(gif_data)
+    _DELAY_CACHE[cache_key] = list(delays)
+    return delays
+
+
+def _parse_gif_frame_delays_uncached(gif_data: bytes) -> list[int]:
     try:
-        try:
-            from PIL import Image
-        except ImportError:
-            logger.warning("Pillow not available, falling back to manual parsing")
-            return []
+        delays = scan_gif_frame_delays(gif_data)
+        logger.info(f"Calculated GIF duration: {sum(delays)/1000:.2f}s from {len(delays)} frames")
+        return delays
+    except (IndexError, ValueError, struct.error) as e:
+        logger.debug(f"GIF block scan failed ({e}), falling back to Pillow")
 
-        img = Image.open(io.BytesIO(gif_data))
+    if PILImage is None:
+        logger.warning("Pillow not available, cannot parse GIF frame delays")
+        return []
+
+    try:
+        img = PILImage.open(io.BytesIO(gif_data))
         if not hasattr(img, 'n_frames'):
             return []
 
@@ -194,33 +348,16 @@ def scale_pixmap_if_needed(pixmap: QtGui.QPixmap, max_width: int, max_height: in
     Does not scale up smaller images.
     Returns the scaled pixmap.
     """
-    original_width = pixmap.width()
-    original_height = pixmap.height()
-    
-    # Calculate scale factors for both dimensions
-    width_scale = 1.0
-    height_scale = 1.0
-    
-    if original_width > max_width:
-        width_scale = max_width / original_width
-    if original_height > max_height:
-        height_scale = max_height / original_height
-    
-    # Use the smaller scale factor to ensure both constraints are met
-    scale_factor = min(width_scale, height_scale)
-    
-    # Only scale if needed
-    if scale_factor < 1.0:
-        new_width = int(original_width * scale_factor)
-        new_height = int(original_height * scale_factor)
-        
-        return pixmap.scaled(
-            new_width, new_height,
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation
-        )
-    
-    return pixmap
+    width = pixmap.width()
+    height = pixmap.height()
+    if width <= max_width and height <= max_height:
+        return pixmap
+
+    # Whichever dimension overflows its limit by the larger ratio bounds the
+    # scale; cross-multiplying keeps the comparison in integers.
+    if width * max_height >= height * max_width:
+        return pixmap.scaledToWidth(max_width, QtCore.Qt.TransformationMode.SmoothTransformation)
+    return pixmap.scaledToHeight(max_height, QtCore.Qt.TransformationMode.SmoothTransformation)
 
 
 def load_packaged_images(
@@ -246,10 +383,14 @@ def load_packaged_images(
     # Read the first GIF from the char (folder or zip, in memory).
     try:
         with char_pack.CharSource(char_path) as source:
-            gif_files = sorted(n for n in source.names() if n.lower().endswith(".gif"))
-            if not gif_files:
+            # min() keeps the "alphabetically first" pick without building and
+            # sorting a list of every GIF name just to take one element.
+            gif_file_name = min(
+                (n for n in source.names() if n.lower().endswith(".gif")),
+                default=None,
+            )
+            if gif_file_name is None:
                 raise ValueError(f"No GIF file found in char: {char_path}")
-            gif_file_name = gif_files[0]
             gif_data = source.read(gif_file_name)
             logger.info(f"Extracted {gif_file_name} from {char_path.name}")
     except zipfile.BadZipFile as exc:
@@ -281,20 +422,48 @@ def load_packaged_images(
     return pixmap, movie, base_name, gif_data
 
 
+# Parsed config.ini cached on (path, mtime, size) — the file only changes
+# through the save helpers below, so repeat readers get the same parser back
+# without re-reading. Same pattern as llm_prompt's settings cache.
+_CFG_CACHE: tuple[tuple, configparser.ConfigParser] | None = None
+
+
+def _config_cache_key() -> tuple:
+    try:
+        st = CFG_FILE.stat()
+        return (str(CFG_FILE), st.st_mtime_ns, st.st_size)
+    except OSError:
+        return (str(CFG_FILE), None, None)
+
+
+def _read_config() -> configparser.ConfigParser:
+    """Return the parsed config.ini (a missing file parses as empty)."""
+    global _CFG_CACHE
+    key = _config_cache_key()
+    if _CFG_CACHE is not None and _CFG_CACHE[0] == key:
+        return _CFG_CACHE[1]
+    config = configparser.ConfigParser()
+    config.read(CFG_FILE)
+    _CFG_CACHE = (key, config)
+    return config
+
+
+def _update_config_cache(config: configparser.ConfigParser) -> None:
+    """Prime the cache with the parser a save helper just wrote to disk."""
+    global _CFG_CACHE
+    _CFG_CACHE = (_config_cache_key(), config)
+
+
 def load_config(screen_width: int, screen_height: int, window_width: int, window_height: int) -> dict:
     """Load configuration from INI file. Returns position for bottom-right corner."""
     # Calculate default position (bottom-right with offset)
     default_x = screen_width - window_width - DEFAULT_POSITION_OFFSET_X
     default_y = screen_height - window_height - DEFAULT_POSITION_OFFSET_Y
     config_data = {'x': default_x, 'y': default_y}
-    
-    if not CFG_FILE.exists():
-        return config_data
-    
+
     try:
-        config = configparser.ConfigParser()
-        config.read(CFG_FILE)
-        
+        config = _read_config()
+
         if 'window' in config:
             if 'x' in config['window']:
                 config_data['x'] = int(config['window']['x'])
@@ -330,20 +499,19 @@ def save_config(config: dict) -> None:
         with open(CFG_FILE, 'w') as f:
             file_config.write(f)
         secret_store.secure_file(CFG_FILE)
+        _update_config_cache(file_config)
     except Exception as e:
         logger.error(f"Config save error: {e}")
 
 
 def load_image_from_ini() -> str | None:
     """Load default image setting from INI file."""
-    if not CFG_FILE.exists():
-        logger.info("INI config not found, using default: cat")
-        return None
-    
     try:
-        config = configparser.ConfigParser()
-        config.read(CFG_FILE)
-        
+        config = _read_config()
+        if not config.sections():  # missing or empty file
+            logger.info("INI config not found, using default: cat")
+            return None
+
         if 'settings' in config and 'default_image' in config['settings']:
             image_name = config['settings']['default_image']
             logger.info(f"Loaded image from INI: {image_name}")
@@ -384,6 +552,7 @@ def save_image_to_ini(image_name: str) -> None:
         with open(CFG_FILE, 'w') as f:
             config.write(f)
         secret_store.secure_file(CFG_FILE)
+        _update_config_cache(config)
 
         logger.info(f"Saved image setting to INI: {image_name}")
     except Exception as e:
@@ -395,11 +564,8 @@ def autostart_was_prompted() -> bool:
 
     Stored as ``[settings] autostart_prompted`` so the user is asked at most once.
     """
-    if not CFG_FILE.exists():
-        return False
     try:
-        config = configparser.ConfigParser()
-        config.read(CFG_FILE)
+        config = _read_config()
         return config.getboolean("settings", "autostart_prompted", fallback=False)
     except Exception as exc:
         logger.debug("Could not read autostart_prompted flag: %s", exc)
@@ -419,6 +585,7 @@ def mark_autostart_prompted() -> None:
         with open(CFG_FILE, "w") as f:
             config.write(f)
         secret_store.secure_file(CFG_FILE)
+        _update_config_cache(config)
     except Exception as exc:
         logger.error("Could not save autostart_prompted flag: %s", exc)
 
@@ -481,13 +648,13 @@ def read_battery_percent():
                 continue
     except OSError:
         pass
-    try:
-        import psutil
-        battery = psutil.sensors_battery()
-        if battery is not None:
-            return int(battery.percent)
-    except Exception:
-        pass
+    if psutil is not None:
+        try:
+            battery = psutil.sensors_battery()
+            if battery is not None:
+                return int(battery.percent)
+        except Exception:
+            pass
     return None
 
 
@@ -499,11 +666,9 @@ def harden_pixmap(pixmap: QtGui.QPixmap, threshold: int = 128) -> QtGui.QPixmap:
     Uses Pillow's C-speed ``point`` on the alpha channel — a Python per-pixel
     loop here froze loads of large multi-frame chars (e.g. girl*, 120
     frames at 281×500)."""
-    from PIL import Image
-
     image = pixmap.toImage().convertToFormat(QtGui.QImage.Format.Format_RGBA8888)
     width, height = image.width(), image.height()
-    pil = Image.frombytes("RGBA", (width, height), image.constBits().tobytes())
+    pil = PILImage.frombytes("RGBA", (width, height), image.constBits().tobytes())
     pil.putalpha(pil.getchannel("A").point(lambda value: 255 if value >= threshold else 0))
     hardened = QtGui.QImage(pil.tobytes("raw", "RGBA"), width, height,
                             QtGui.QImage.Format.Format_RGBA8888)
@@ -519,6 +684,13 @@ class UpdateSignals(QtCore.QObject):
     failed = QtCore.Signal(str)           # error message
 
 
+class CharLoadSignals(QtCore.QObject):
+    """Marshals the char-archive reader thread back onto the GUI thread."""
+
+    loaded = QtCore.Signal(str, bytes)    # image name, GIF bytes from the archive
+    failed = QtCore.Signal(str)           # error message
+
+
 class PixelCatWindow(QtWidgets.QWidget):
     """Main cat window widget with PNG/GIF animation and dragging."""
     
@@ -588,6 +760,33 @@ class PixelCatWindow(QtWidgets.QWidget):
         self.dragging = False
         self.drag_start_pos = QtCore.QPoint()
 
+        # Debounced position save: dropping the cat several times in a short
+        # burst rewrites config.ini once, not once per release.
+        self.save_position_timer = QtCore.QTimer(self)
+        self.save_position_timer.setSingleShot(True)
+        self.save_position_timer.setInterval(500)
+        self.save_position_timer.timeout.connect(self.save_position)
+
+        # Char switching: archive reads run off the GUI thread; the generation
+        # counter lets a quick second pick supersede a still-loading first one.
+        # Recently used legacy chars keep their GIF bytes in a small LRU so
+        # flipping back needs no disk at all.
+        self.char_load_generation = 0
+        self.char_load_signals = None
+        self.char_bytes_cache: dict[str, bytes] = {}
+
+        # Legacy playback pacing: frames are scheduled against absolute
+        # deadlines on a monotonic clock so per-frame timer error can't
+        # accumulate over the clip.
+        self.anim_clock = QtCore.QElapsedTimer()
+        self.frame_deadlines: list[int] = []
+
+        # Cached paint centering: recomputed only when frame or window size
+        # changes, not on every paint.
+        self.center_key = None
+        self.center_x = 0
+        self.center_y = 0
+
         # Set window size to pixmap size (pack: bounding box over all frames).
         self.resize(self.pack_content_size() if self.char_pack is not None else self.current_pixmap.size())
 
@@ -640,27 +839,34 @@ class PixelCatWindow(QtWidgets.QWidget):
     def setup_gif_content(self, png_pixmap, gif_movie, gif_data) -> None:
         """Legacy single-GIF char: static first frame + play-once animation."""
         self.png_pixmap = png_pixmap
-        self.gif_movie = gif_movie
         self.gif_data = gif_data
         self.current_pixmap = self.png_pixmap
-        self.gif_movie.jumpToFrame(0)
-        original_size = self.gif_movie.currentPixmap().size()
+        gif_movie.jumpToFrame(0)
+        original_size = gif_movie.currentPixmap().size()
         self.original_size = original_size
-        self.gif_duration, self.frame_delays = get_gif_duration(self.gif_movie, self.gif_data)
+        self.gif_duration, self.frame_delays = get_gif_duration(gif_movie, self.gif_data)
         if not self.frame_delays:
-            frame_count = self.gif_movie.frameCount()
+            frame_count = gif_movie.frameCount()
             if frame_count > 0 and self.gif_duration > 0:
                 self.frame_delays = [int((self.gif_duration / frame_count) * 1000)] * frame_count
             else:
                 self.frame_delays = [100]
-        self.first_frame_pixmap = self.png_pixmap.copy()
+        self.first_frame_pixmap = self.png_pixmap  # implicitly shared; never mutated
         self.state = 'png'
-        self.gif_movie.setCacheMode(QtGui.QMovie.CacheMode.CacheAll)
-        self.gif_movie.setSpeed(100)
+        gif_movie.setCacheMode(QtGui.QMovie.CacheMode.CacheAll)
+        gif_movie.setSpeed(100)
+        self.gif_frames = decode_movie_frames(gif_movie)
+        # Single-shot: each tick schedules the next one itself, so a tick is
+        # one start(delay) instead of a stop()+start() pair.
         self.animation_timer = QtCore.QTimer(self)
+        self.animation_timer.setSingleShot(True)
         self.animation_timer.timeout.connect(self.on_animation_frame)
         self.current_frame = 0
-        gif_size = self.gif_movie.scaledSize()
+        gif_size = gif_movie.scaledSize()
+        # Playback only walks gif_frames from here on — free the decoder and
+        # its compose buffers instead of keeping them for the window's life.
+        gif_movie.deleteLater()
+        self.gif_movie = None
         logger.info(
             f"Playing {self.file_name}.zip {original_size.width()}x{original_size.height()} > "
             f"{gif_size.width()}x{gif_size.height()} (first_frame, {self.wait_time:.1f}s static)"
@@ -703,8 +909,9 @@ class PixelCatWindow(QtWidgets.QWidget):
         self.png_pixmap = pack.static
         self.gif_movie = None
         self.gif_data = b""
+        self.gif_frames = []
         self.current_pixmap = pack.static
-        self.first_frame_pixmap = pack.static.copy()
+        self.first_frame_pixmap = pack.static  # implicitly shared; never mutated
         self.original_size = pack.static.size()
         self.state = 'png'
         self.gif_duration, self.frame_delays = 0.0, []
@@ -732,7 +939,7 @@ class PixelCatWindow(QtWidgets.QWidget):
 
         self.pack_timer = QtCore.QTimer(self)
         self.pack_timer.timeout.connect(self.pack_tick)
-        self.pack_timer.start(33)             # ~30 fps; only repaints when something changed
+        self.pack_timer.start(PACK_TICK_ACTIVE_MS)  # only repaints when something changed
         logger.info(
             f"Loaded interactive char '{pack.name}' ({pack.static.width()}x{pack.static.height()}; "
             f"eyes={pack.eyes is not None} blink={pack.blink_enabled} "
@@ -760,8 +967,21 @@ class PixelCatWindow(QtWidgets.QWidget):
         changed = self.current_pixmap is not previous
         if moved and self.pack_mode == "open" and self.char_pack.eyes is not None:
             changed = True
-        if changed:
+        # While the user drags the cat every move already repaints the window;
+        # piling explicit updates on top just adds recomposition. State keeps
+        # advancing — the release handler repaints once with the final frame.
+        if changed and not self.dragging:
             self.update()
+        # While the cat sleeps nothing on screen can change until an interaction
+        # (handled by the mouse events, not this tick), so a ~30 fps tick only
+        # burns wakeups. Drop to a slow tick and restore full rate on wake.
+        interval = (
+            PACK_TICK_SLEEP_MS
+            if self.base_state == "sleeping" and self.active_clip is None
+            else PACK_TICK_ACTIVE_MS
+        )
+        if self.pack_timer.interval() != interval:
+            self.pack_timer.setInterval(interval)
 
     def clip_frame(self, anim, age_ms: float):
         accumulated = 0
@@ -1013,18 +1233,50 @@ class PixelCatWindow(QtWidgets.QWidget):
         if char_pack.is_new_pack(zip_path):
             self.switch_to_pack(image_name, zip_path)
             return
+
+        cached = self.char_bytes_cache.get(image_name)
+        if cached is not None:
+            self.char_load_generation += 1
+            self.finish_load_image(image_name, cached, self.char_load_generation)
+            return
+
+        # Read the archive (the disk-bound half, slow on cold caches) off the
+        # GUI thread, same shape as the update-check worker; the Qt-side decode
+        # and the commit run back on the main thread via the queued signal.
+        self.char_load_generation += 1
+        generation = self.char_load_generation
+        signals = CharLoadSignals(self)
+        self.char_load_signals = signals  # keep alive while the read runs
+        signals.loaded.connect(lambda name, data: self.finish_load_image(name, bytes(data), generation))
+        signals.failed.connect(logger.error)
+
+        def read() -> None:
+            try:
+                with char_pack.CharSource(zip_path) as source:
+                    gif_file_name = min(
+                        (n for n in source.names() if n.lower().endswith(".gif")),
+                        default=None,
+                    )
+                    if gif_file_name is None:
+                        signals.failed.emit(f"No GIF found in char: {image_name}")
+                        return
+                    gif_data = source.read(gif_file_name)
+                    logger.info("Extracted %s from %s", gif_file_name, Path(zip_path).name)
+                parse_gif_frame_delays(gif_data)  # warm the delay cache off-thread
+                signals.loaded.emit(image_name, gif_data)
+            except Exception as exc:  # noqa: BLE001 -- a bad char must never kill the thread silently
+                signals.failed.emit(f"Error loading {image_name}: {exc}")
+
+        threading.Thread(target=read, name="mycat-char-load", daemon=True).start()
+
+    def finish_load_image(self, image_name: str, gif_data: bytes, generation: int) -> None:
+        """Decode and commit a char whose bytes the reader thread delivered."""
+        if generation != self.char_load_generation:
+            return  # a newer pick superseded this load while it was reading
         # Decode the new char into locals first — a failure here must not leave
         # the window half-switched. Only once everything is built do we commit
         # to self.* and resize the window (mirrors switch_to_pack).
         try:
-            with char_pack.CharSource(zip_path) as source:
-                gif_files = sorted(n for n in source.names() if n.lower().endswith(".gif"))
-                if not gif_files:
-                    logger.error("No GIF found in char: %s", image_name)
-                    return
-                gif_data = source.read(gif_files[0])
-                logger.info("Extracted %s from %s", gif_files[0], Path(zip_path).name)
-
             new_movie = movie_from_gif_bytes(gif_data)
             new_movie.jumpToFrame(0)
             first_frame = new_movie.currentPixmap()
@@ -1050,6 +1302,7 @@ class PixelCatWindow(QtWidgets.QWidget):
             new_movie.jumpToFrame(0)
             movie_frame_size = new_movie.currentPixmap().size()
             gif_duration, frame_delays = get_gif_duration(new_movie, gif_data)
+            new_frames = decode_movie_frames(new_movie)
         except Exception:  # noqa: BLE001 -- a bad char must never corrupt the current one
             logger.exception("Error loading %s", image_name)
             return
@@ -1061,18 +1314,22 @@ class PixelCatWindow(QtWidgets.QWidget):
             else:
                 frame_delays = [100]  # default 100ms per frame
 
+        # Done with the decoder — playback only walks new_frames from here on.
+        new_movie.deleteLater()
+
         # Decoded cleanly — commit the switch. The Qt calls below don't raise, so
         # the old char stays fully intact if anything above failed.
         if self.char_pack is not None:
             self.teardown_pack_mode()
         self.png_pixmap = new_pixmap
-        self.gif_movie = new_movie
+        self.gif_movie = None
         self.gif_data = gif_data
+        self.gif_frames = new_frames
         self.file_name = image_name
         self.original_size = movie_frame_size
         self.gif_duration = gif_duration
         self.frame_delays = frame_delays
-        self.first_frame_pixmap = new_pixmap.copy()
+        self.first_frame_pixmap = new_pixmap  # implicitly shared; never mutated
 
         self.current_pixmap = self.png_pixmap
         self.state = 'png'
@@ -1088,6 +1345,12 @@ class PixelCatWindow(QtWidgets.QWidget):
         new_size = self.png_pixmap.size()
         self.move(bottom_right_x - new_size.width(), bottom_right_y - new_size.height())
 
+        # Remember the bytes (re-inserting refreshes recency; oldest falls out).
+        self.char_bytes_cache.pop(image_name, None)
+        self.char_bytes_cache[image_name] = gif_data
+        while len(self.char_bytes_cache) > CHAR_BYTES_CACHE_MAX:
+            self.char_bytes_cache.pop(next(iter(self.char_bytes_cache)))
+
         save_image_to_ini(image_name)
         self.save_position()
         logger.info("Switched to %s.zip %dx%d", image_name, self.png_pixmap.width(), self.png_pixmap.height())
@@ -1101,6 +1364,7 @@ class PixelCatWindow(QtWidgets.QWidget):
         self.char_pack = None
         if getattr(self, "animation_timer", None) is None:
             self.animation_timer = QtCore.QTimer(self)
+            self.animation_timer.setSingleShot(True)
             self.animation_timer.timeout.connect(self.on_animation_frame)
         self.current_frame = 0
 
@@ -1173,7 +1437,7 @@ class PixelCatWindow(QtWidgets.QWidget):
         menu.addSeparator()
 
         # Rebuild the list every time so freshly-installed chars appear without restart.
-        self.available_images = char_catalog.scan_all()
+        self.available_images = scan_chars()
         if len(self.available_images) > 0:
             images_menu = menu.addMenu("Chars")
             create_action = images_menu.addAction("Generate…")
@@ -1248,7 +1512,10 @@ class PixelCatWindow(QtWidgets.QWidget):
         if not char_catalog.remove_installed(char_id):
             QtWidgets.QMessageBox.warning(self, "Delete custom character", "The character could not be deleted.")
             return
-        self.available_images = char_catalog.scan_all()
+        # Invalidate explicitly — the watcher's change event may land after this scan.
+        _invalidate_chars_cache()
+        self.char_bytes_cache.pop(char_id, None)
+        self.available_images = scan_chars()
         if was_active:
             fallback = "cat" if char_catalog.find_char("cat") else next(iter(self.available_images), "")
             if fallback:
@@ -1504,13 +1771,31 @@ class PixelCatWindow(QtWidgets.QWidget):
         QtWidgets.QMessageBox.warning(self, "Update failed", f"Couldn't update: {message}")
 
     def on_char_installed(self, _char_id: str) -> None:
-        self.available_images = char_catalog.scan_all()
+        # Invalidate explicitly — the watcher's change event may land after this scan.
+        _invalidate_chars_cache()
+        self.available_images = scan_chars()
 
     def on_char_uninstalled(self, char_id: str) -> None:
-        self.available_images = char_catalog.scan_all()
+        _invalidate_chars_cache()
+        self.char_bytes_cache.pop(char_id, None)
+        self.available_images = scan_chars()
         if self.file_name == char_id and self.available_images:
             self.load_image(self.available_images[0])
     
+    def set_current_pixmap(self, pixmap: QtGui.QPixmap) -> None:
+        """Swap the displayed pixmap, repainting only if the pixels changed.
+
+        cacheKey() identifies the underlying pixel data, so re-showing the
+        same frame (single-frame GIFs, the reset to the idle pose when it's
+        already on screen) costs no repaint. Mid-drag repaints are skipped
+        the same way the tick paths do — the move repaints anyway, and
+        mouseReleaseEvent repaints on drop.
+        """
+        changed = pixmap.cacheKey() != self.current_pixmap.cacheKey()
+        self.current_pixmap = pixmap
+        if changed and not self.dragging:
+            self.update()
+
     def schedule_next_animation(self) -> None:
         """Schedule the next PNG -> GIF transition with a single-shot timer."""
         delay_ms = max(0, int(self.wait_time * 1000))
@@ -1521,59 +1806,57 @@ class PixelCatWindow(QtWidgets.QWidget):
         if self.state != 'png':
             return
 
-        gif_size = self.gif_movie.scaledSize()
+        gif_size = self.current_pixmap.size()
         logger.debug(
             f"Playing {self.file_name}.zip {self.original_size.width()}x{self.original_size.height()} > "
             f"{gif_size.width()}x{gif_size.height()} (animation, {self.gif_duration:.2f}s)"
         )
         self.state = 'gif'
 
-        # Reset to the in-memory first frame for a fresh start
+        # Reset to the in-memory first frame for a fresh start; playback then
+        # walks the pre-decoded gif_frames list — no QMovie rebuild needed.
         if not self.png_pixmap.isNull():
-            self.current_pixmap = self.png_pixmap
-            self.update()
-
-        # Recreate the movie from the in-memory GIF bytes for a fresh start
-        self.gif_movie = movie_from_gif_bytes(self.gif_data)
-        self.gif_movie.setScaledSize(self.current_pixmap.size())
-        self.gif_movie.setCacheMode(QtGui.QMovie.CacheMode.CacheAll)
-        self.gif_movie.setSpeed(100)
-        self.gif_movie.jumpToFrame(0)
+            self.set_current_pixmap(self.png_pixmap)
 
-        # Start manual frame-by-frame animation with per-frame delays
+        # Start manual frame-by-frame animation with per-frame delays. Frame i
+        # is due at frame_deadlines[i] ms after this point; each tick schedules
+        # the gap to the next deadline rather than the nominal delay, so timer
+        # jitter doesn't drift the clip.
         self.current_frame = 0
-        self.animation_timer.stop()
-        if self.frame_delays:
-            self.animation_timer.start(self.frame_delays[0])
-        else:
-            self.animation_timer.start(100)
+        if not self.frame_delays:
+            self.frame_delays = [100] * max(1, len(self.gif_frames))
+        self.frame_deadlines = list(itertools.accumulate(self.frame_delays))
+        self.anim_clock.start()
+        self.animation_timer.start(self.frame_delays[0])
 
     def on_animation_frame(self) -> None:
         """Manually advance to next frame at controlled speed."""
-        frame_count = self.gif_movie.frameCount()
+        frame_count = len(self.gif_frames)
 
         # Check if we've completed the animation
         if self.current_frame >= frame_count:
-            self.animation_timer.stop()
             logger.debug(f"Animation complete for {self.file_name} ({frame_count} frames)")
             QtCore.QTimer.singleShot(50, self.complete_switch_to_png)
             return
 
-        # Jump to current frame and display it
-        self.gif_movie.jumpToFrame(self.current_frame)
-        pixmap = self.gif_movie.currentPixmap()
-        if not pixmap.isNull():
-            self.current_pixmap = pixmap
-            self.update()
+        # Display the pre-decoded frame (no per-tick trip through the decoder)
+        self.set_current_pixmap(self.gif_frames[self.current_frame])
 
-        # Move to next frame
-        self.current_frame += 1
+        # Move to the frame the clock says is due. Normally that's just the
+        # next one, but after a stall (heavy paint, GC pause) this jumps past
+        # the missed frames instead of painting each stale one in a burst.
+        self.current_frame = max(
+            self.current_frame + 1,
+            bisect.bisect_right(self.frame_deadlines, self.anim_clock.elapsed()),
+        )
 
-        # If not done, stop current timer and restart with next frame's delay
-        if self.current_frame < frame_count and self.frame_delays and self.current_frame < len(self.frame_delays):
-            delay = self.frame_delays[self.current_frame]
-            self.animation_timer.stop()
-            self.animation_timer.start(delay)
+        # Schedule the next tick at the next absolute deadline; past the end,
+        # one nominal delay lets the completion branch above run.
+        if self.current_frame < len(self.frame_deadlines):
+            next_deadline = self.frame_deadlines[self.current_frame]
+        else:
+            next_deadline = self.frame_deadlines[-1] if self.frame_deadlines else 100
+        self.animation_timer.start(max(0, next_deadline - self.anim_clock.elapsed()))
 
     def complete_switch_to_png(self) -> None:
         """Complete the switch from GIF to PNG state."""
@@ -1584,25 +1867,31 @@ class PixelCatWindow(QtWidgets.QWidget):
             # Reuse the in-memory first frame
             static_pixmap = self.png_pixmap
             if not static_pixmap.isNull():
-                self.current_pixmap = static_pixmap
                 self.first_frame_pixmap = static_pixmap
+                self.set_current_pixmap(static_pixmap)
 
             logger.debug(
                 f"Playing {self.file_name}.zip {self.original_size.width()}x{self.original_size.height()} > "
                 f"{self.png_pixmap.width()}x{self.png_pixmap.height()} (first_frame, {self.wait_time:.1f}s static)"
             )
-            self.update()
             self.schedule_next_animation()
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
         """Paint the current pixmap (+ tracking pupils for interactive chars)."""
         mode = getattr(self, "pack_mode", None) if self.char_pack is not None else None
 
-        # Centre the pixmap in the widget.
-        widget_rect = self.rect()
-        pixmap_rect = self.current_pixmap.rect()
-        x = (widget_rect.width() - pixmap_rect.width()) // 2
-        y = (widget_rect.height() - pixmap_rect.height()) // 2
+        # Centre the pixmap in the widget (offsets cached across paints; most
+        # frames repaint at the same size as the last one).
+        size_key = (
+            self.current_pixmap.width(), self.current_pixmap.height(),
+            self.width(), self.height(),
+        )
+        if size_key != self.center_key:
+            self.center_key = size_key
+            self.center_x = (size_key[2] - size_key[0]) // 2
+            self.center_y = (size_key[3] - size_key[1]) // 2
+        x = self.center_x
+        y = self.center_y
 
         # Update the silhouette mask BEFORE painting: the backing-store -> screen
         # blit at the end of this paint is clipped to the *current* mask, so any
@@ -1612,8 +1901,10 @@ class PixelCatWindow(QtWidgets.QWidget):
         if self.shape_mask_enabled:
             self.refresh_shape_mask(x, y)
 
+        # No Antialiasing hint: this paint is integer-offset pixmap blits only
+        # (the hint affects vector primitives, not drawPixmap) and leaving it
+        # off keeps the raster engine on its plain blit path.
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
         painter.drawPixmap(x, y, self.current_pixmap)
         if mode == "open":
             self.draw_pupils(painter, x, y)
@@ -1683,6 +1974,13 @@ class PixelCatWindow(QtWidgets.QWidget):
         """Handle mouse release to stop dragging and save position."""
         if event.button() == QtCore.Qt.MouseButton.LeftButton and self.dragging:
             self.dragging = False
+            self.update()  # show whatever frame the suppressed ticks landed on
+            self.save_position_timer.start()
+
+    def flush_position_save(self) -> None:
+        """Write a still-pending debounced position save immediately."""
+        if self.save_position_timer.isActive():
+            self.save_position_timer.stop()
             self.save_position()
 
 def parse_args() -> argparse.Namespace:
@@ -2223,11 +2521,20 @@ def main() -> None:
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
-    # Allow signal handling during Qt event loop
-    timer = QtCore.QTimer()
-    timer.timeout.connect(lambda: None)  # Allow Python signal handlers to run
-    timer.start(100)  # Check every 100ms
-    
+    # Wake the Qt event loop only when a signal actually arrives: the
+    # interpreter's C-level handler writes a byte to this socket, the notifier
+    # drains it, and the Python handlers above get to run. (Previously a dummy
+    # 100 ms timer woke the loop 10x/s just to give them a chance.)
+    signal_rsock, signal_wsock = socket.socketpair()
+    signal_rsock.setblocking(False)
+    signal_wsock.setblocking(False)
+    signal.set_wakeup_fd(signal_wsock.fileno())
+    signal_notifier = QtCore.QSocketNotifier(
+        signal_rsock.fileno(), QtCore.QSocketNotifier.Type.Read
+    )
+    signal_notifier.activated.connect(lambda *_: signal_rsock.recv(4096))
+
+
     # Scan for available ZIP files
     available_images = scan_chars()
     logger.info(f"Found {len(available_images)} ZIP archive(s): {', '.join(available_images)}")
@@ -2286,6 +2593,8 @@ def main() -> None:
         app.setQuitOnLastWindowClosed(window.tray_icon is None)
         # Flush the in-progress activity minute on a clean Quit.
         app.aboutToQuit.connect(lambda: flush_activity_on_quit(window))
+        # And any debounced position save still waiting on its timer.
+        app.aboutToQuit.connect(window.flush_position_save)
         # First-run nudge to start on login (after the cat is up).
         QtCore.QTimer.singleShot(600, lambda: offer_autostart_on_first_run(window))
 
@@ -84,6 +84,22 @@ def test_yawn_then_sleep_then_wake(qapp, tmp_path, monkeypatch):
     assert w.base_state == "awake"
 
 
+def test_sleeping_slows_the_tick_and_waking_restores_it(qapp, tmp_path, monkeypatch):
+    w, _ = make_window(qapp, tmp_path, monkeypatch)
+
+    w.test_now = 2.5                                # idle > sleep_after -> sleep_in
+    w.update_pack_frame()
+    w.test_now = 2.8                                # sleep_in finished -> sleeping
+    w.pack_tick()
+    assert w.base_state == "sleeping"
+    assert w.pack_timer.interval() == m.PACK_TICK_SLEEP_MS
+
+    w.test_now = 3.0                                # interaction wakes -> sleep_out
+    w.wake(w.pack_now())
+    w.pack_tick()
+    assert w.pack_timer.interval() == m.PACK_TICK_ACTIVE_MS
+
+
 def test_click_plays_reaction(qapp, tmp_path, monkeypatch):
     w, _ = make_window(qapp, tmp_path, monkeypatch)
     w.test_now = 4.0
@@ -0,0 +1,31 @@
+"""GIF frame-delay extraction: header-only block scan vs Pillow ground truth."""
+
+import io
+
+from PIL import Image
+
+import mycat.main as m
+
+
+def gif_bytes(delays):
+    frames = [Image.new("RGBA", (8, 8), (i * 30, 0, 0, 255)) for i in range(len(delays))]
+    buffer = io.BytesIO()
+    frames[0].save(
+        buffer, format="GIF", save_all=True, append_images=frames[1:],
+        duration=list(delays), loop=0,
+    )
+    return buffer.getvalue()
+
+
+def test_scan_matches_pillow_delays():
+    data = gif_bytes([120, 30, 500, 80])
+    image = Image.open(io.BytesIO(data))
+    expected = []
+    for index in range(image.n_frames):
+        image.seek(index)
+        expected.append(image.info.get("duration", 100))
+    assert m.scan_gif_frame_delays(data) == expected
+
+
+def test_parse_falls_back_on_garbage():
+    assert m.parse_gif_frame_delays(b"not a gif at all") == []
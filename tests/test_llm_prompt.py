@@ -57,6 +57,20 @@ def test_save_ollama_settings_preserves_other_sections(monkeypatch, tmp_path):
     assert "[ollama]" in text
 
 
+def test_history_tail_seeks_on_large_files(tmp_path):
+    path = tmp_path / "history.txt"
+    with path.open("w") as handle:
+        for index in range(3000):
+            handle.write(f"[2024-01-01 00:00:{index % 60:02d}] REQUEST:\nmessage {index}\n")
+    assert path.stat().st_size > llm_prompt.HISTORY_TAIL_FULL_PARSE_MAX  # tail-seek path
+
+    tail = llm_prompt.get_history_tail(path, 2)
+    assert tail == [
+        "[2024-01-01 00:00:58] REQUEST:", "message 2998",
+        "[2024-01-01 00:00:59] REQUEST:", "message 2999",
+    ]
+
+
 def test_llm_enabled_default_true(monkeypatch, tmp_path):
     use_tmp_config(monkeypatch, tmp_path)
     monkeypatch.delenv("LLM_ENABLED", raising=False)